@@ -22,15 +22,21 @@ Notes:
  - Default: require at least one uppercase and one special symbol, shuffle the final result.
  - Increase --max to allow more outputs; default is 200000 (safety).
  - Use --no-shuffle, --no-enforce-upper, --no-enforce-symbol to relax defaults.
+ - --no-shuffle keeps generation order; add --deterministic-order to sort it (stable across runs).
+ - --jobs N runs per-name generation in N worker processes (0 = all CPUs); output is the same as --jobs 1.
  - Be mindful of combinatorial explosion.
 """
 from __future__ import annotations
 
 import argparse
+import functools
 import itertools
+import math
+import multiprocessing
+import os
 import random
 import sys
-from typing import List, Set
+from typing import Collection, Dict, FrozenSet, Iterable, Iterator, List, Tuple
 
 # ---------------- common list (100-ish) ----------------
 COMMON_100_INSTAGRAM = [
@@ -54,42 +60,45 @@ LEET_MAP = {
     'l': ['1', '|'], 'o': ['0'], 's': ['5', '$'], 't': ['7']
 }
 DEFAULT_SPECIALS = list('!@#$%^&*()-_+=[]{};:,.<>?/\\|~`')
+# stop generating once this many times --max unique candidates exist (headroom so the shuffled cut still samples widely)
+CAP_SAFETY_FACTOR = 2
+# upper bound on how many candidates are pulled from one stream per round-robin turn
+ROUND_ROBIN_CHUNK = 512
 
 # ---------------- small helpers ----------------
-def generate_leet_variants(s: str, max_variants: int = 8) -> Set[str]:
-    s0 = s
+# both return insertion-ordered tuples so downstream order does not depend on the hash seed
+def generate_leet_variants(s: str, max_variants: int = 8) -> Tuple[str, ...]:
     low = s.lower()
-    variants = {s0, low}
-    # single char replacements
-    for i,ch in enumerate(low):
-        if ch in LEET_MAP:
-            for rep in LEET_MAP[ch]:
-                arr = list(low)
-                arr[i] = rep
-                variants.add(''.join(arr))
-                if len(variants) >= max_variants:
-                    return set(list(variants)[:max_variants])
+    variants = dict.fromkeys((s, low))  # insertion-ordered, so the cap keeps the first variants found
+    # single char replacements (patch one slot of a shared template, then restore it)
+    buf = list(low)
+    positions = [i for i,ch in enumerate(low) if ch in LEET_MAP]
+    for i in positions:
+        orig = buf[i]
+        for rep in LEET_MAP[orig]:
+            buf[i] = rep
+            variants[''.join(buf)] = None
+            if len(variants) >= max_variants:
+                return tuple(variants)
+        buf[i] = orig
     # full mapped (first choice)
-    mapped = ''.join(LEET_MAP[c][0] if c in LEET_MAP else c for c in low)
-    variants.add(mapped)
+    for i in positions:
+        buf[i] = LEET_MAP[low[i]][0]
+    variants[''.join(buf)] = None
     # mixed pattern
     mixed = list(low)
     repcount = 0
-    for i,ch in enumerate(low):
-        if ch in LEET_MAP and repcount % 2 == 0:
-            mixed[i] = LEET_MAP[ch][0]
+    for i in positions:
+        if repcount % 2 == 0:
+            mixed[i] = LEET_MAP[low[i]][0]
             repcount += 1
-    variants.add(''.join(mixed))
-    return set(list(variants)[:max_variants])
+    variants[''.join(mixed)] = None
+    return tuple(itertools.islice(variants, max_variants))
 
-def cap_variants(s: str, caps: bool) -> Set[str]:
-    v = {s}
+def cap_variants(s: str, caps: bool) -> Tuple[str, ...]:
     if not caps:
-        return v
-    v.add(s.lower())
-    v.add(s.upper())
-    v.add(s.capitalize())
-    return v
+        return (s,)
+    return tuple(dict.fromkeys((s, s.lower(), s.upper(), s.capitalize())))
 
 def extract_phone_prefixes(phone: str, min_n: int, max_n: int) -> List[str]:
     digits = ''.join([c for c in phone if c.isdigit()])
@@ -107,55 +116,82 @@ COMMON_NAME_SUFFIXES = [
 ]
 COMMON_NAME_PREFIXES = ['123','007','111','1','!','@']
 
-def generate_name_common_patterns(names: List[str], symbols: List[str], years: List[str]) -> Set[str]:
-    out = set()
+def generate_name_common_patterns(names: List[str], symbols: List[str], years: List[str]) -> List[str]:
+    out = []
     sym_list = symbols if symbols else DEFAULT_SPECIALS
+    sym5 = tuple(sym_list[:5])
     for name in names:
         low = name.lower()
         cap = name.capitalize()
+        # name + symbol heads are independent of the suffix/year, so build them once per name
+        low_syms = tuple(low + sym for sym in sym5)
+        cap_syms = tuple(cap + sym for sym in sym5)
         # suffixes and symbol combos
         for suf in COMMON_NAME_SUFFIXES:
-            out.add(low + suf)
-            out.add(cap + suf)
+            out.append(low + suf)
+            out.append(cap + suf)
             # with symbol between name and suffix
-            for sym in sym_list[:5]:
-                out.add(low + sym + suf)
-                out.add(cap + sym + suf)
+            out.extend(ls + suf for ls in low_syms)
+            out.extend(cs + suf for cs in cap_syms)
         # prefixes
         for pre in COMMON_NAME_PREFIXES:
-            out.add(pre + low)
-            out.add(pre + cap)
-            for sym in sym_list[:5]:
-                out.add(pre + sym + low)
+            out.append(pre + low)
+            out.append(pre + cap)
+            out.extend(pre + sym + low for sym in sym5)
         # years
         for y in (years or []):
-            out.add(low + y)
-            out.add(cap + y)
-            for sym in sym_list[:5]:
-                out.add(low + sym + y)
-                out.add(cap + sym + y)
-    return out
+            out.append(low + y)
+            out.append(cap + y)
+            out.extend(ls + y for ls in low_syms)
+            out.extend(cs + y for cs in cap_syms)
+    # ordered (not a set) so a capped run picks the same patterns whatever the hash seed
+    return list(dict.fromkeys(out))
+
+def expand_name_common(name_common: List[str], caps: bool, leet: bool,
+                       symbol_pool: List[str], require_upper: bool, require_symbol: bool) -> Iterator[str]:
+    """Lazily yield caps/leet variants of the name-common patterns, enforced like everything else."""
+    need = required_bits(require_upper, require_symbol)
+    symbol_set = frozenset(symbol_pool)
+    seen = set()
+    expanded = set()  # patterns overlap once case-folded ('aswin1' vs 'Aswin1'), so leet each form only once
+    for p in name_common:
+        for c in cap_variants(p, caps):
+            if c in expanded:
+                continue
+            expanded.add(c)
+            for v in (c,) + (generate_leet_variants(c) if leet else ()):
+                if v in seen:
+                    continue
+                seen.add(v)
+                bits = token_bits(v, symbol_set)
+                yield v if bits & need == need else enforce_tail(v, bits, need, symbol_pool)
 
 # ---------------- generate many permutations ----------------
-def insert_symbol_positions(name: str, symbols: List[str], seps: List[str]) -> Set[str]:
+def insert_symbol_positions(name: str, symbols: List[str], seps: List[str]) -> List[str]:
     """Produce variants where a symbol is inserted at different positions inside or around the name."""
-    out = set()
+    out = []
     sym_list = symbols if symbols else DEFAULT_SPECIALS
     # prefix/suffix
     for sym in sym_list:
-        out.add(sym + name)
-        out.add(name + sym)
+        out.append(sym + name)
+        out.append(name + sym)
     # insert after first char, after second, middle, before last
     L = len(name)
     indices = [1, 2, max(1, L//2), max(1, L-1)]
-    for i in set(indices):
+    for i in sorted(set(indices)):
         if i < L:
+            # slice once per position, and pre-attach separators, instead of per symbol
+            left = name[:i]
+            right = name[i:]
             for sym in sym_list:
-                out.add(name[:i] + sym + name[i:])
-                # with separators as well
-                for sep in seps:
-                    out.add(name[:i] + sep + sym + sep + name[i:])
-    return out
+                out.append(left + sym + right)
+            # with separators as well
+            for sep in seps:
+                left_sep = left + sep
+                sep_right = sep + right
+                out.extend(left_sep + sym + sep_right for sym in sym_list)
+    # dedupe keeping insertion order (a set would make the order depend on the hash seed)
+    return list(dict.fromkeys(out))
 
 def combine_all(name_variants: List[str],
                 phone_prefixes: List[str],
@@ -163,80 +199,364 @@ def combine_all(name_variants: List[str],
                 years: List[str],
                 symbols: List[str],
                 seps: List[str],
-                include_inner_symbol_positions: bool = True) -> Set[str]:
-    out = set()
+                include_inner_symbol_positions: bool = True,
+                require_upper: bool = False,
+                require_symbol: bool = False) -> Iterator[str]:
+    """Lazily yield name + number/phone/year/symbol combinations (may repeat; caller dedupes).
+
+    Requirements are enforced while building: each token's upper/symbol bits are computed once and
+    OR-ed along the concat, so only strings missing a required class are touched again.
+    Uses a loop body specialized for this symbol/separator set when one can be built.
+    """
     sym_list = symbols if symbols else DEFAULT_SPECIALS
+    need = required_bits(require_upper, require_symbol)
+    specialized = _specialize_combine_all(tuple(sym_list), tuple(seps), include_inner_symbol_positions, need)
+    if specialized is None:
+        return _combine_all_generic(name_variants, phone_prefixes, numbers, years, symbols, seps,
+                                    include_inner_symbol_positions, need)
+    sym_set = frozenset(sym_list)
+    bits_of = {t: token_bits(t, sym_set) for t in itertools.chain(numbers, phone_prefixes, years)}
+    return specialized(name_variants, phone_prefixes, numbers, years, bits_of, sym_set)
+
+def _combine_all_generic(name_variants: List[str],
+                         phone_prefixes: List[str],
+                         numbers: List[str],
+                         years: List[str],
+                         symbols: List[str],
+                         seps: List[str],
+                         include_inner_symbol_positions: bool,
+                         need: int) -> Iterator[str]:
+    sym_list = symbols if symbols else DEFAULT_SPECIALS
+    sym_set = frozenset(sym_list)
+    bits_of = {t: token_bits(t, sym_set) for t in itertools.chain(numbers, phone_prefixes, years, sym_list, seps)}
+    # inner-symbol variants are the name's chars + one symbol (+ seps); exact unless a symbol/sep has uppercase
+    inner_upper = any(bits_of[t] & UPPER_BIT for t in itertools.chain(sym_list, seps))
+
+    # loop-invariant slices and a pre-bound join: multi-part strings are built in one allocation,
+    # and shared prefixes (name + sep, name + sep + n) are built once per loop level
+    sym4 = sym_list[:4]
+    sym6 = sym_list[:6]
+    join = ''.join
+
+    def emit(s: str, bits: int) -> str:
+        return s if bits & need == need else enforce_tail(s, bits, need, sym_list)
 
     # Basic combos: name + phoneprefix, name + number, name + year, and with separators
     for name in name_variants:
-        out.add(name)
+        nb = token_bits(name, sym_set)
+        yield emit(name, nb)
         # append numbers
         for n in numbers:
-            out.add(name + n)
+            b = nb | bits_of[n]
+            yield emit(name + n, b)
             for sep in seps:
-                out.add(name + sep + n)
-                out.add(n + sep + name)
-                for sym in sym_list[:4]:
-                    out.add(name + sep + sym + n)
-                    out.add(name + sep + n + sym)
+                bs = b | bits_of[sep]
+                name_sep = name + sep
+                name_sep_n = name_sep + n
+                yield emit(name_sep_n, bs)
+                yield emit(join((n, sep, name)), bs)
+                for sym in sym4:
+                    yield emit(join((name_sep, sym, n)), bs | bits_of[sym])
+                    yield emit(name_sep_n + sym, bs | bits_of[sym])
         # phone prefixes
         for p in phone_prefixes:
-            out.add(name + p)
+            b = nb | bits_of[p]
+            yield emit(name + p, b)
             for sep in seps:
-                out.add(name + sep + p)
-                out.add(p + sep + name)
-                for sym in sym_list[:4]:
-                    out.add(name + sep + sym + p)
+                bs = b | bits_of[sep]
+                name_sep = name + sep
+                yield emit(name_sep + p, bs)
+                yield emit(join((p, sep, name)), bs)
+                for sym in sym4:
+                    yield emit(join((name_sep, sym, p)), bs | bits_of[sym])
         # years
         for y in years:
-            out.add(name + y)
+            b = nb | bits_of[y]
+            yield emit(name + y, b)
             for sep in seps:
-                out.add(name + sep + y)
-                out.add(y + sep + name)
-                for sym in sym_list[:4]:
-                    out.add(name + sep + y + sym)
+                bs = b | bits_of[sep]
+                name_sep_y = join((name, sep, y))
+                yield emit(name_sep_y, bs)
+                yield emit(join((y, sep, name)), bs)
+                for sym in sym4:
+                    yield emit(name_sep_y + sym, bs | bits_of[sym])
         # append symbols
-        for sym in sym_list[:6]:
-            out.add(name + sym)
+        for sym in sym6:
+            b = nb | bits_of[sym]
+            yield emit(name + sym, b)
             for sep in seps:
-                out.add(name + sep + sym)
+                yield emit(join((name, sep, sym)), b | bits_of[sep])
         # insert symbol inside name
         if include_inner_symbol_positions:
             for v in insert_symbol_positions(name, symbols, seps):
-                out.add(v)
-    return out
+                yield emit(v, token_bits(v, sym_set) if inner_upper else nb | SYMBOL_BIT)
+
+# Above this many separators the unrolled source gets large enough that compiling it stops paying off.
+MAX_SPECIALIZED_SEPS = 8
+
+@functools.lru_cache(maxsize=32)
+def _specialize_combine_all(sym_list: Tuple[str, ...],
+                            seps: Tuple[str, ...],
+                            include_inner_symbol_positions: bool,
+                            need: int):
+    """Compile a combine_all body with the symbol/separator loops unrolled for one run's constants.
+
+    Symbol and separator bits are folded in at build time, so strings that always satisfy the
+    requirements skip the check entirely. Returns None to fall back to the generic loops.
+    """
+    if len(seps) > MAX_SPECIALIZED_SEPS:
+        return None
+    sym_set = frozenset(sym_list)
+    bits_of = {t: token_bits(t, sym_set) for t in itertools.chain(sym_list, seps)}
+    inner_upper = any(bits_of[t] & UPPER_BIT for t in itertools.chain(sym_list, seps))
+    src = []
+
+    def line(depth: int, code: str) -> None:
+        src.append('    ' * depth + code)
+
+    def concat(*parts: str) -> str:
+        # parts are variable names or ('lit',) tuples; adjacent literals merge, empty ones vanish
+        out, lit = [], ''
+        for part in parts:
+            if isinstance(part, tuple):
+                lit += part[0]
+                continue
+            if lit:
+                out.append(repr(lit)); lit = ''
+            out.append(part)
+        if lit or not out:
+            out.append(repr(lit))
+        return ' + '.join(out)
+
+    def emit(depth: int, expr: str, dyn: str, const: int) -> None:
+        rest = need & ~const
+        if not rest:
+            line(depth, f'yield {expr}')
+            return
+        line(depth, f's = {expr}')
+        line(depth, f'yield s if {dyn} & {rest} == {rest} else _enforce(s, {dyn} | {const}, {need}, _pool)')
+
+    line(0, 'def _combine(name_variants, phone_prefixes, numbers, years, bits_of, sym_set):')
+    line(1, 'for name in name_variants:')
+    line(2, 'nb = _token_bits(name, sym_set)' if need else 'nb = 0')
+    emit(2, 'name', 'nb', 0)
+    # numbers and phone prefixes share a shape; years put the symbol after the token
+    for var, seq, sym_first, sym_last in (('n', 'numbers', True, True),
+                                          ('p', 'phone_prefixes', True, False),
+                                          ('y', 'years', False, True)):
+        line(2, f'for {var} in {seq}:')
+        line(3, f'b = nb | bits_of[{var}]' if need else 'b = 0')
+        emit(3, concat('name', var), 'b', 0)
+        for k, sep in enumerate(seps):
+            sb = bits_of[sep]
+            line(3, f'head{k} = {concat("name", (sep,), var)}')
+            emit(3, f'head{k}', 'b', sb)
+            emit(3, concat(var, (sep,), 'name'), 'b', sb)
+            for sym in sym_list[:4]:
+                if sym_first:
+                    emit(3, concat('name', (sep + sym,), var), 'b', sb | bits_of[sym])
+                if sym_last:
+                    emit(3, concat(f'head{k}', (sym,)), 'b', sb | bits_of[sym])
+    # append symbols
+    for sym in sym_list[:6]:
+        emit(2, concat('name', (sym,)), 'nb', bits_of[sym])
+        for sep in seps:
+            emit(2, concat('name', (sep + sym,)), 'nb', bits_of[sym] | bits_of[sep])
+    # insert symbol inside name
+    if include_inner_symbol_positions:
+        line(2, 'for v in _insert_symbol_positions(name, _pool, _seps):')
+        if inner_upper:
+            emit(3, 'v', '_token_bits(v, sym_set)', 0)
+        else:
+            emit(3, 'v', 'nb', SYMBOL_BIT)
+
+    namespace = {'_enforce': enforce_tail, '_token_bits': token_bits,
+                 '_insert_symbol_positions': insert_symbol_positions,
+                 '_pool': list(sym_list), '_seps': list(seps)}
+    exec(compile('\n'.join(src), '<specialized combine_all>', 'exec'), namespace)
+    return namespace['_combine']
+
+def combine_names(name_variants: List[str],
+                  seps: List[str],
+                  combo: int,
+                  limit: int,
+                  symbol_pool: List[str],
+                  require_upper: bool = False,
+                  require_symbol: bool = False) -> Iterator[str]:
+    """Lazily yield r-length name permutations (2 <= r <= combo) joined with each separator.
+
+    Each tuple yields one string per separator, so the permutation stream for each r is cut at
+    ceil(limit / len(seps)) tuples and huge inputs never get expanded much past `limit` strings.
+    """
+    need = required_bits(require_upper, require_symbol)
+    # duplicate variants would only produce duplicate tuples (and strings) for the caller to dedupe
+    name_variants = list(dict.fromkeys(name_variants))
+    sym_set = frozenset(symbol_pool)
+    bits_of = {t: token_bits(t, sym_set) for t in itertools.chain(name_variants, seps)}
+    joiners = [(sep.join, bits_of[sep]) for sep in seps]
+    tuple_limit = -(-limit // max(1, len(seps)))
+    for r in range(2, combo+1):
+        for tup in itertools.islice(itertools.permutations(name_variants, r), tuple_limit):
+            tb = 0
+            for part in tup:
+                tb |= bits_of[part]
+            for join, sb in joiners:
+                b = tb | sb
+                s = join(tup)
+                yield s if b & need == need else enforce_tail(s, b, need, symbol_pool)
 
 # ---------------- ensure requirements ----------------
+# Inputs are almost always ASCII (names, digits, ASCII symbols), so the checks below take an ASCII
+# fast path first: a lower() comparison for uppercase and a bytes.translate deletion table for
+# symbols. Non-ASCII words fall back to per-codepoint tests driven by map(); pass a set as
+# symbol_pool there for O(1) membership.
+
 def has_upper(s: str) -> bool:
-    return any(c.isupper() for c in s)
+    if s.isascii():
+        return s.lower() != s
+    return any(map(str.isupper, s))
 
-def has_symbol(s: str, symbol_pool: List[str]) -> bool:
+@functools.lru_cache(maxsize=64)
+def _non_symbol_table(symbol_pool: FrozenSet[str]) -> bytes:
+    """bytes.translate deletion table that strips every byte except the pool's ASCII symbols."""
+    keep = {ord(c) for c in symbol_pool if len(c) == 1 and c.isascii()}
+    return bytes(c for c in range(256) if c not in keep)
+
+def has_symbol(s: str, symbol_pool: Collection[str]) -> bool:
     if symbol_pool:
-        return any(c in symbol_pool for c in s)
-    return any(not c.isalnum() for c in s)
+        if s.isascii():
+            # one C-level pass: delete every non-symbol byte, anything left is a symbol
+            pool = symbol_pool if isinstance(symbol_pool, frozenset) else frozenset(symbol_pool)
+            return bool(s.encode('ascii').translate(None, _non_symbol_table(pool)))
+        return any(map(symbol_pool.__contains__, s))
+    return not all(map(str.isalnum, s))
 
-def minimally_enforce(s: str, require_upper: bool, require_symbol: bool, symbol_pool: List[str]) -> str:
+# requirement bits per string/token: (upper << 1) | symbol
+UPPER_BIT = 2
+SYMBOL_BIT = 1
+
+def token_bits(s: str, symbol_pool: Collection[str]) -> int:
+    return (UPPER_BIT if has_upper(s) else 0) | (SYMBOL_BIT if has_symbol(s, symbol_pool) else 0)
+
+def required_bits(require_upper: bool, require_symbol: bool) -> int:
+    return (UPPER_BIT if require_upper else 0) | (SYMBOL_BIT if require_symbol else 0)
+
+def enforce_tail(s: str, bits: int, need: int, symbol_pool: List[str]) -> str:
+    """Fix up `s` for every class in `need` that is missing from its precomputed `bits`."""
     out = s
     # uppercase
-    if require_upper and not has_upper(out):
-        # capitalize first alphabetical char if exists else prepend 'A'
-        lst = list(out)
-        for i,ch in enumerate(lst):
-            if ch.isalpha():
-                lst[i] = lst[i].upper()
-                out = ''.join(lst)
-                break
-        else:
-            out = 'A' + out
+    if need & UPPER_BIT and not bits & UPPER_BIT:
+        # always prepend 'A' (O(1), no scan for the first letter to capitalize)
+        out = 'A' + out
     # symbol
-    if require_symbol and not has_symbol(out, symbol_pool):
+    if need & SYMBOL_BIT and not bits & SYMBOL_BIT:
         if symbol_pool:
             out = out + symbol_pool[0]
         else:
             out = out + '!'
     return out
 
+def minimally_enforce(s: str, require_upper: bool, require_symbol: bool, symbol_pool: List[str]) -> str:
+    need = required_bits(require_upper, require_symbol)
+    if not need:
+        return s
+    return enforce_tail(s, token_bits(s, symbol_pool), need, symbol_pool)
+
+# enforced COMMON_100_INSTAGRAM depends only on the policy, so it is built once per policy and reused
+_COMMON_ENFORCED_CACHE: Dict[Tuple[bool, bool, Tuple[str, ...]], List[str]] = {}
+
+def enforced_common(require_upper: bool, require_symbol: bool, symbol_pool: List[str]) -> List[str]:
+    key = (require_upper, require_symbol, tuple(symbol_pool))
+    cached = _COMMON_ENFORCED_CACHE.get(key)
+    if cached is None:
+        cached = _COMMON_ENFORCED_CACHE[key] = [
+            minimally_enforce(p, require_upper, require_symbol, symbol_pool) for p in COMMON_100_INSTAGRAM]
+    return cached
+
+# ---------------- sampling ----------------
+_END = object()
+
+def _unit_random() -> float:
+    """random.random() but never 0.0, so it is always safe to take the log of."""
+    r = random.random()
+    while r == 0.0:
+        r = random.random()
+    return r
+
+def reservoir_sample(items: Iterable[str], k: int) -> List[str]:
+    """Pick k items uniformly at random from a stream in one pass (Li's Algorithm L).
+
+    Only O(k * log(n/k)) random draws are needed since whole runs of items are skipped at once.
+    The result is not in random order; shuffle it if that matters.
+    """
+    if k <= 0:
+        return []
+    it = iter(items)
+    reservoir = list(itertools.islice(it, k))
+    if len(reservoir) < k:
+        return reservoir
+    w = math.exp(math.log(_unit_random()) / k)
+    while True:
+        if w <= 0.0:
+            # acceptance probability underflowed: nothing further would ever be picked
+            return reservoir
+        # how many items to pass over before the next replacement
+        skip = int(math.log(_unit_random()) / math.log1p(-w)) if w < 1.0 else 0
+        nxt = next(itertools.islice(it, skip, None), _END)
+        if nxt is _END:
+            return reservoir
+        reservoir[random.randrange(k)] = nxt
+        w *= math.exp(math.log(_unit_random()) / k)
+
+def round_robin(streams: List[Iterable[str]], chunk: int) -> Iterator[List[str]]:
+    """Yield batches of up to `chunk` items taken from each stream in turn until all run dry.
+
+    A consumer that stops at a cap then trims every stream evenly instead of dropping the later ones.
+    """
+    iters = [iter(st) for st in streams]
+    while iters:
+        alive = []
+        for it in iters:
+            batch = list(itertools.islice(it, chunk))
+            if batch:
+                yield batch
+            if len(batch) == chunk:
+                alive.append(it)
+        iters = alive
+
 # ---------------- main orchestrator ----------------
+def _gen_for_name(task: tuple, config: tuple) -> List[str]:
+    """Worker entry point: items [start, stop) of combine_all over one base name's variants (top-level so it pickles).
+
+    Items before `start` are regenerated and skipped; slices double in length, so that is at most as
+    much work again.
+    """
+    variants, start, stop = task
+    phone_prefixes, numbers, years, symbols, seps, require_upper, require_symbol = config
+    return list(itertools.islice(combine_all(variants, phone_prefixes, numbers, years, symbols, seps,
+                                             include_inner_symbol_positions=True,
+                                             require_upper=require_upper, require_symbol=require_symbol),
+                                 start, stop))
+
+def _pooled_stream(pool, worker, variants: List[str], first: int, limit: int) -> Iterator[str]:
+    """Stream the first `limit` items of one name's combinations from the worker pool, a slice at a time.
+
+    The first slice (`first` items) is submitted right away so every name's share is computed side by
+    side. Each later slice is twice as long as the one before and is only submitted once round_robin
+    has used up the previous one, so a capped run never computes much past what it keeps.
+    """
+    def stream(pending, start: int, stop: int) -> Iterator[str]:
+        while True:
+            batch = pending.get()
+            yield from batch
+            if len(batch) < stop - start or stop >= limit:
+                return
+            start, stop = stop, min(limit, 2 * stop)
+            pending = pool.apply_async(worker, ((variants, start, stop),))
+
+    stop = min(first, limit)
+    return stream(pool.apply_async(worker, ((variants, 0, stop),)), 0, stop)
+
 def generate_aggressive(base_words: List[str],
                         include_common: bool,
                         phone: str,
@@ -254,7 +574,10 @@ def generate_aggressive(base_words: List[str],
                         require_upper: bool,
                         require_symbol: bool,
                         shuffle_final: bool,
-                        append_common_verbatim: bool) -> List[str]:
+                        append_common_verbatim: bool,
+                        deterministic_order: bool = False,
+                        jobs: int = 1) -> List[str]:
+    max_items = max(0, max_items)
 
     # Expand and dedupe base names (with repeats)
     names = []
@@ -265,26 +588,23 @@ def generate_aggressive(base_words: List[str],
                 for r in range(2, repeat+1):
                     names.append(w * r)
     # dedupe keep order
-    seen = set(); dedup_names = []
-    for n in names:
-        if n not in seen:
-            seen.add(n); dedup_names.append(n)
-    names = dedup_names
+    names = list(dict.fromkeys(names))
 
-    # name variants: caps + leet
-    name_variants = []
+    # name variants: caps + leet, grouped per base name
+    variants_by_name = []
+    seen = set()
     for n in names:
+        nv = []
         for c in cap_variants(n, caps):
-            name_variants.append(c)
+            nv.append(c)
             if leet:
-                for lv in generate_leet_variants(c):
-                    name_variants.append(lv)
-    # dedupe
-    seen = set(); nv = []
-    for n in name_variants:
-        if n not in seen:
-            seen.add(n); nv.append(n)
-    name_variants = nv
+                nv.extend(generate_leet_variants(c))
+        # drop variants an earlier name already produced: each variant belongs to exactly one name's
+        # stream (and, with --jobs, one worker), so nothing is generated twice
+        nv = [v for v in dict.fromkeys(nv) if v not in seen]
+        seen.update(nv)
+        variants_by_name.append(nv)
+    name_variants = [v for nv in variants_by_name for v in nv]
 
     # prepare numbers list (either explicit numbers_from or default small range)
     numbers = numbers_from or []
@@ -294,68 +614,84 @@ def generate_aggressive(base_words: List[str],
     # phone prefixes
     phone_prefixes = extract_phone_prefixes(phone, phone_min, phone_max)
 
-    # Generate name-common patterns and include them
-    name_common = generate_name_common_patterns(names, symbols, years)
-    # Expand name_common with caps/leet optionally
-    expanded_name_common = set()
-    for p in name_common:
-        for c in cap_variants(p, caps):
-            expanded_name_common.add(c)
-            if leet:
-                for lv in generate_leet_variants(c):
-                    expanded_name_common.add(lv)
-
     # Combine permutations for each name variant
-    generated = set()
-    # base combine
-    generated.update(combine_all(name_variants, phone_prefixes, numbers, years, symbols, seps, include_inner_symbol_positions=True))
-    # combos across names up to 'combo' length (joined with separators)
-    if combo > 1:
-        for r in range(2, combo+1):
-            for tup in itertools.permutations(name_variants, r):
-                for sep in seps:
-                    generated.add(sep.join(tup))
-    # include expanded name_common
-    generated.update(expanded_name_common)
-
-    # minimally enforce requirements for each generated password
+    # (streams are lazy and already enforced; stop pulling as soon as we have enough candidates)
     symbol_pool = symbols if symbols else DEFAULT_SPECIALS
-    # deterministic ordering before enforcement
-    gen_sorted = sorted(generated)
-    final_gen = []
-    for p in gen_sorted:
-        p2 = minimally_enforce(p, require_upper, require_symbol, symbol_pool)
-        final_gen.append(p2)
-
-    # Append common list if requested (either verbatim or enforced)
-    final = list(final_gen)
+    generated = {}  # insertion-ordered dict used as the one dedupe structure for the whole run
+    gen_cap = max_items * CAP_SAFETY_FACTOR
+    # one stream per base name and per name's common patterns, plus the cross-name combos
+    n_streams = 2 * len(variants_by_name) + (1 if combo > 1 else 0)
+    # take turns between streams in batches (the insert loop runs in C, not per item in Python);
+    # batches are kept small enough that one full round stays well under the cap
+    chunk = max(1, min(ROUND_ROBIN_CHUNK, gen_cap // (4 * max(1, n_streams))))
+    # per-name work is independent, so with --jobs > 1 it is farmed out to worker processes
+    pool = multiprocessing.Pool(jobs) if jobs > 1 and len(variants_by_name) > 1 else None
+    try:
+        # one stream per base name, so the cap is shared between names rather than spent on the first one
+        if pool is not None:
+            worker = functools.partial(_gen_for_name, config=(phone_prefixes, numbers, years, symbols, seps,
+                                                              require_upper, require_symbol))
+            # each name's even share of the cap is computed up front; the rest only if it gets used
+            share = -(-gen_cap // n_streams)
+            streams = [_pooled_stream(pool, worker, nv, share, gen_cap) for nv in variants_by_name]
+        else:
+            # capped the same way as the pooled streams, so --jobs never changes the output
+            streams = [itertools.islice(combine_all(nv, phone_prefixes, numbers, years, symbols, seps,
+                                                    include_inner_symbol_positions=True,
+                                                    require_upper=require_upper, require_symbol=require_symbol),
+                                        gen_cap)
+                       for nv in variants_by_name]
+        # combos across names up to 'combo' length (joined with separators), as a stream of its own
+        if combo > 1:
+            streams.append(combine_names(name_variants, seps, combo, gen_cap, symbol_pool,
+                                         require_upper=require_upper, require_symbol=require_symbol))
+        # name-common patterns (one stream per base name) share the cap like every other stream
+        streams.extend(expand_name_common(generate_name_common_patterns([n], symbols, years), caps, leet,
+                                          symbol_pool, require_upper, require_symbol)
+                       for n in names)
+        for batch in round_robin(streams, chunk):
+            generated.update(zip(batch[:gen_cap - len(generated)], itertools.repeat(None)))
+            if len(generated) >= gen_cap:
+                break
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+    # Append common list if requested (either verbatim or enforced);
+    # `generated` doubles as the seen-set so nothing is hashed into a second set
+    n_generated = len(generated)
     if include_common:
         if append_common_verbatim:
-            final.extend(COMMON_100_INSTAGRAM)
+            common = COMMON_100_INSTAGRAM
         else:
-            for p in COMMON_100_INSTAGRAM:
-                p2 = p
-                # transform to meet requirements minimally
-                p2 = minimally_enforce(p2, require_upper, require_symbol, symbol_pool)
-                final.append(p2)
-
-    # dedupe preserving order-ish
-    seen = set(); ordered = []
-    for p in final:
-        if p not in seen:
-            seen.add(p); ordered.append(p)
-
-    # shuffle if requested
+            # transformed to meet requirements minimally
+            common = enforced_common(require_upper, require_symbol, symbol_pool)
+        generated.update(zip(common, itertools.repeat(None)))
+
     if shuffle_final:
+        # random subset of max_items from the dedupe dict, then shuffle only that
+        # (uniform over what was generated; the cap already trimmed every stream evenly)
+        ordered = reservoir_sample(generated, max_items)
         random.shuffle(ordered)
-
-    # cap
-    if len(ordered) > max_items:
-        ordered = ordered[:max_items]
+    elif deterministic_order:
+        # generated block sorted, common list after it
+        ordered = sorted(itertools.islice(generated, n_generated))
+        ordered.extend(itertools.islice(generated, n_generated, None))
+        # cap
+        del ordered[max_items:]
+    else:
+        # generation (insertion) order, no sort
+        ordered = list(itertools.islice(generated, max_items))
 
     return ordered
 
 # ---------------- CLI ----------------
+def non_negative_int(value: str) -> int:
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {n}")
+    return n
+
 def parse_args():
     ap = argparse.ArgumentParser(description="Aggressive name-based password generator (many permutations + shuffle)")
     ap.add_argument('-w','--words', help='Comma-separated names/words (e.g. aswin,india)', default='')
@@ -373,10 +709,12 @@ def parse_args():
     ap.add_argument('--leet', action='store_true', help='Produce leetspeak variants')
     ap.add_argument('--repeat', type=int, default=1, help='Repeat each name up to N times (e.g. 2 -> name+name)')
     ap.add_argument('--combo', type=int, default=2, help='Max number of names to concat in combos')
-    ap.add_argument('--max', type=int, default=200000, help='Maximum passwords to output (safety cap)')
+    ap.add_argument('--jobs', type=non_negative_int, default=1, help='Worker processes for per-name generation (0 = all CPUs)')
+    ap.add_argument('--max', type=non_negative_int, default=200000, help='Maximum passwords to output (safety cap)')
     ap.add_argument('--include-common', action='store_true', help='Append common-100 list')
     ap.add_argument('--append-common-verbatim', action='store_true', help='Append the common list verbatim')
     ap.add_argument('--no-shuffle', dest='shuffle', action='store_false', help='Do NOT shuffle final list')
+    ap.add_argument('--deterministic-order', action='store_true', help='With --no-shuffle, sort the output for a stable order across runs')
     ap.add_argument('--no-enforce-upper', dest='enforce_upper', action='store_false', help='Do NOT enforce uppercase requirement')
     ap.add_argument('--no-enforce-symbol', dest='enforce_symbol', action='store_false', help='Do NOT enforce symbol requirement')
     ap.set_defaults(shuffle=True, enforce_upper=True, enforce_symbol=True)
@@ -436,13 +774,16 @@ def main():
         require_upper=args.enforce_upper,
         require_symbol=args.enforce_symbol,
         shuffle_final=args.shuffle,
-        append_common_verbatim=args.append_common_verbatim
+        append_common_verbatim=args.append_common_verbatim,
+        deterministic_order=args.deterministic_order,
+        jobs=args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
     )
 
     try:
-        with open(args.output, 'w', encoding='utf-8') as fh:
-            for item in out:
-                fh.write(item + '\n')
+        # binary + large buffer: one C-level writelines over pre-encoded lines instead of a text write per item
+        # (binary mode means lines always end in LF, with no CRLF translation on Windows)
+        with open(args.output, 'wb', buffering=1 << 20) as fh:
+            fh.writelines(item.encode('utf-8') + b'\n' for item in out)
         print(f"Wrote {len(out)} passwords to {args.output} (max cap {args.max})")
         print(f"Shuffled: {args.shuffle}, enforced uppercase: {args.enforce_upper}, enforced symbol: {args.enforce_symbol}")
     except Exception as e:
@@ -0,0 +1,46 @@
+"""combine_all has two implementations: the runtime-specialized body and the generic loops it
+falls back to. They must yield exactly the same strings in the same order."""
+import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import generate_wordlist as g
+
+NAMES = ['bob', 'Al1ce', 'JOSÉ', 'x', '']
+PHONE_PREFIXES = ['78', '787']
+NUMBERS = ['1', '22']
+YEARS = ['1999', '2000']
+SYMBOL_SETS = [[], list('@#'), list('A@'), list('!'), ["'", '"', '\\'], ['é', '€']]
+SEP_SETS = [[''], ['', '_', '.'], ['X', ''], ['@#'], ["'", '"'], ['\\', '\\\\'], ['ü', '—'], ["'''", '"""']]
+
+
+def _check(symbols, seps, inner, require_upper, require_symbol):
+    args = (NAMES, PHONE_PREFIXES, NUMBERS, YEARS, symbols, seps)
+    need = g.required_bits(require_upper, require_symbol)
+    expected = list(g._combine_all_generic(*args, inner, need))
+    got = list(g.combine_all(*args, include_inner_symbol_positions=inner,
+                             require_upper=require_upper, require_symbol=require_symbol))
+    assert got == expected, (symbols, seps, inner, require_upper, require_symbol)
+
+
+def test_specialized_matches_generic():
+    for symbols, seps, inner, ru, rs in itertools.product(SYMBOL_SETS, SEP_SETS, [True, False],
+                                                          [False, True], [False, True]):
+        sym_list = symbols if symbols else g.DEFAULT_SPECIALS
+        assert g._specialize_combine_all(tuple(sym_list), tuple(seps), inner,
+                                         g.required_bits(ru, rs)) is not None
+        _check(symbols, seps, inner, ru, rs)
+
+
+def test_too_many_seps_falls_back_to_generic():
+    seps = [str(i) for i in range(g.MAX_SPECIALIZED_SEPS + 1)]
+    assert g._specialize_combine_all(tuple(g.DEFAULT_SPECIALS), tuple(seps), True, 3) is None
+    _check([], seps, True, True, True)
+
+
+if __name__ == '__main__':
+    test_specialized_matches_generic()
+    test_too_many_seps_falls_back_to_generic()
+    print('ok')